@@ -0,0 +1,58 @@
+"""Add customer analytics rollups
+
+Revision ID: b7d31e9a4c02
+Revises: f5ba0344c43c
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d31e9a4c02'
+down_revision: Union[str, None] = 'f5ba0344c43c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('customer_rollups',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('rfm_segment', sa.String(length=100), nullable=False),
+    sa.Column('primary_category', sa.String(length=100), nullable=False),
+    sa.Column('customers', sa.Integer(), nullable=False),
+    sa.Column('total_spent', sa.Numeric(precision=16, scale=2), nullable=False),
+    sa.Column('avg_order_value_sum', sa.Numeric(precision=16, scale=2), nullable=False),
+    sa.Column('clv_sum', sa.Numeric(precision=16, scale=2), nullable=False),
+    sa.Column('clv_count', sa.Integer(), nullable=False),
+    sa.Column('churn_high', sa.Integer(), nullable=False),
+    sa.Column('churn_medium', sa.Integer(), nullable=False),
+    sa.Column('churn_low', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'rfm_segment', 'primary_category')
+    )
+    op.create_table('customer_rollup_contributions',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('rfm_segment', sa.String(length=100), nullable=False),
+    sa.Column('primary_category', sa.String(length=100), nullable=False),
+    sa.Column('total_spent', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('avg_order_value', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('clv_score', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('churn_risk', sa.String(length=50), nullable=True),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('rollup_watermarks',
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.create_index('ix_customers_updated_at', 'customers', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_customers_updated_at', table_name='customers')
+    op.drop_table('rollup_watermarks')
+    op.drop_table('customer_rollup_contributions')
+    op.drop_table('customer_rollups')
@@ -0,0 +1,30 @@
+"""FastAPI application entry point"""
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+
+from ..core.config import settings
+from . import ws
+
+
+def create_app() -> FastAPI:
+    """Build the FastAPI application"""
+    app = FastAPI(title=settings.APP_NAME, version=settings.APP_VERSION)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    app.include_router(ws.router)
+    return app
+
+
+app = create_app()
+
+
+def run() -> None:
+    """Entry point for the ``liquor-api`` script"""
+    import uvicorn
+
+    uvicorn.run("liquor_agent.api.main:app", host="0.0.0.0", port=8000)
@@ -0,0 +1,160 @@
+"""WebSocket endpoints for realtime campaign status"""
+import asyncio
+import json
+import logging
+from typing import Any, Dict, List, Optional, Set
+
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
+
+from ..core.config import settings
+from ..core.events import campaign_status_channel, get_event_bus
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+def coalesce(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Collapse a tick's worth of events into what a dashboard needs.
+
+    Lifecycle events pass through in order. All ``send_completed`` events are
+    replaced by a single one carrying the latest progress and a count of the
+    sends it stands for, placed where the first of them arrived.
+    """
+    out: List[Dict[str, Any]] = []
+    slot: Optional[int] = None
+    last: Optional[Dict[str, Any]] = None
+    counts = {"sent": 0, "failed": 0, "skipped": 0}
+    for event in events:
+        if event.get("event") != "send_completed":
+            out.append(event)
+            continue
+        status = event.get("status")
+        counts[status if status in counts else "failed"] += 1
+        last = event
+        if slot is None:
+            slot = len(out)
+            out.append(event)
+    if last is not None:
+        out[slot] = {
+            "event": "send_completed",
+            "campaign_id": last.get("campaign_id"),
+            "status": last.get("status"),
+            "progress": last.get("progress"),
+            "batch": counts,
+        }
+    return out
+
+
+class CampaignStatusHub:
+    """
+    Single bus subscription for one campaign, fanned out to its sockets.
+
+    Events are buffered and flushed once per tick, so every client gets at
+    most one message per tick and the payload is serialized once for all.
+    A client that can't take a message within one tick is dropped. If the
+    subscription or flush task dies (e.g. Redis goes away) every socket is
+    closed so clients can reconnect.
+    """
+
+    def __init__(self, bus: Any, campaign_id: str, tick: float) -> None:
+        self.bus = bus
+        self.campaign_id = campaign_id
+        self.tick = tick
+        self.sockets: Set[WebSocket] = set()
+        self._pending: List[Dict[str, Any]] = []
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._pump()),
+            asyncio.create_task(self._flush_loop()),
+        ]
+        for task in self._tasks:
+            task.add_done_callback(self._on_task_done)
+
+    def _on_task_done(self, task: asyncio.Task) -> None:
+        if task.cancelled():
+            return
+        logger.error(
+            "Campaign status hub for %s stopped", self.campaign_id, exc_info=task.exception()
+        )
+        asyncio.create_task(self._fail())
+
+    async def _fail(self) -> None:
+        if _hubs.get(self.campaign_id) is self:
+            del _hubs[self.campaign_id]
+        sockets, self.sockets = list(self.sockets), set()
+        await self.stop()
+        await asyncio.gather(*(self._close(ws, 1011) for ws in sockets))
+
+    async def _close(self, ws: WebSocket, code: int) -> None:
+        try:
+            await asyncio.wait_for(ws.close(code=code), self.tick)
+        except Exception:
+            pass
+
+    async def stop(self) -> None:
+        current = asyncio.current_task()
+        tasks = [t for t in self._tasks if t is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _pump(self) -> None:
+        async for event in self.bus.subscribe(campaign_status_channel(self.campaign_id)):
+            self._pending.append(event)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.tick)
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Send buffered events to every socket as one batched update"""
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        payload = json.dumps({"campaign_id": self.campaign_id, "events": coalesce(batch)})
+        sockets = list(self.sockets)
+        results = await asyncio.gather(
+            *(asyncio.wait_for(ws.send_text(payload), self.tick) for ws in sockets),
+            return_exceptions=True,
+        )
+        dropped = [ws for ws, result in zip(sockets, results) if isinstance(result, Exception)]
+        for ws in dropped:
+            self.sockets.discard(ws)
+        if dropped:
+            # 1013 "try again later": client fell behind or went away
+            await asyncio.gather(*(self._close(ws, 1013) for ws in dropped))
+
+
+_hubs: Dict[str, CampaignStatusHub] = {}
+
+
+@router.websocket("/ws/campaign/{campaign_id}/status")
+async def campaign_status(
+    websocket: WebSocket,
+    campaign_id: str,
+    bus: Any = Depends(get_event_bus),
+) -> None:
+    """Stream batched campaign status updates (see API_SPECIFICATION.md)"""
+    await websocket.accept()
+    hub = _hubs.get(campaign_id)
+    if hub is None:
+        hub = _hubs[campaign_id] = CampaignStatusHub(bus, campaign_id, settings.WS_TICK_MS / 1000)
+        hub.start()
+    hub.sockets.add(websocket)
+    try:
+        while True:
+            # Clients don't send anything; this just notices disconnects.
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        hub.sockets.discard(websocket)
+        if not hub.sockets and _hubs.get(campaign_id) is hub:
+            del _hubs[campaign_id]
+            await hub.stop()
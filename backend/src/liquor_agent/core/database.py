@@ -1,28 +1,179 @@
 """Database connection and session management"""
-from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import declarative_base
+import re
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncGenerator, Dict, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.orm import Session, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.sql.elements import TextClause
 
 from .config import settings
 
-# Convert postgresql:// to postgresql+asyncpg://
-DATABASE_URL = settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
 
-# Create async engine
-engine = create_async_engine(
-    DATABASE_URL,
-    pool_size=settings.DATABASE_POOL_SIZE,
-    max_overflow=settings.DATABASE_MAX_OVERFLOW,
-    echo=settings.LOG_LEVEL == "DEBUG",
-)
+def async_url(url: str) -> str:
+    """Convert postgresql:// to postgresql+asyncpg://"""
+    return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+
+@dataclass
+class PoolMetrics:
+    """Connection pool counters, cumulative since the pool was created"""
+    checkouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+    overflow_peak: int = 0
+
+
+class MeteredQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that records checkout counts, queue wait and overflow use.
+
+    Wait time covers only blocking on the pool's queue for a free
+    connection; opening new connections and pre-ping are not included.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+        queue_get = self._pool.get
+
+        def timed_get(block: bool = True, timeout: Optional[float] = None) -> Any:
+            started = time.perf_counter()
+            try:
+                return queue_get(block, timeout)
+            finally:
+                waited = time.perf_counter() - started
+                self.metrics.wait_seconds_total += waited
+                self.metrics.wait_seconds_max = max(self.metrics.wait_seconds_max, waited)
+
+        self._pool.get = timed_get  # type: ignore[method-assign]
+
+    def connect(self):  # type: ignore[override]
+        conn = super().connect()
+        self.metrics.checkouts += 1
+        self.metrics.overflow_peak = max(self.metrics.overflow_peak, self.overflow())
+        return conn
 
-# Create async session factory
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
+    def snapshot(self) -> Dict[str, Any]:
+        """Current pool state plus cumulative metrics"""
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            **asdict(self.metrics),
+        }
+
+
+_WRITE_SQL = re.compile(
+    r"^\s*(insert|update|delete|merge|upsert|replace|create|alter|drop|truncate|grant|revoke)\b",
+    re.IGNORECASE,
 )
 
+
+class ReadOnlySession(Session):
+    """
+    Session for replica traffic; refuses writes.
+
+    ORM flushes and Core ``insert``/``update``/``delete`` or write-looking
+    ``text()`` statements raise before reaching the database, and on
+    PostgreSQL each transaction is also started ``READ ONLY`` so anything
+    that slips through fails there, even when reads share the primary.
+    """
+
+    def flush(self, objects: Optional[Any] = None) -> None:
+        if self.new or self.dirty or self.deleted:
+            raise RuntimeError("Attempted to write through a read-only (replica) session")
+        super().flush(objects)
+
+    def execute(self, statement: Any, *args: Any, **kwargs: Any) -> Any:
+        if getattr(statement, "is_dml", False) or (
+            isinstance(statement, TextClause) and _WRITE_SQL.match(statement.text)
+        ):
+            raise RuntimeError("Attempted to write through a read-only (replica) session")
+        return super().execute(statement, *args, **kwargs)
+
+
+@event.listens_for(ReadOnlySession, "after_begin")
+def _begin_read_only(session: Session, transaction: Any, connection: Any) -> None:
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql("SET TRANSACTION READ ONLY")
+
+
+def create_engine_for(url: str, **overrides: Any) -> AsyncEngine:
+    """Create an async engine with the app's pool settings"""
+    engine_url = make_url(async_url(url))
+    kwargs: Dict[str, Any] = dict(
+        poolclass=MeteredQueuePool,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+        echo=settings.LOG_LEVEL == "DEBUG",
+    )
+    if engine_url.get_driver_name() == "asyncpg":
+        # SQLAlchemy's per-connection prepared statement cache, plus asyncpg's own
+        cache_size = settings.DATABASE_STATEMENT_CACHE_SIZE
+        # Keep the URL object: str(URL) masks the password as "***".
+        engine_url = engine_url.update_query_dict({"prepared_statement_cache_size": str(cache_size)})
+        kwargs["connect_args"] = {"statement_cache_size": cache_size}
+    kwargs.update(overrides)
+    return create_async_engine(engine_url, **kwargs)
+
+
+class DatabaseRouter:
+    """
+    Routes sessions to the primary or, for read-only work, a replica.
+
+    Without a replica URL both routes share the primary engine.
+    """
+
+    def __init__(self, primary_url: str, replica_url: Optional[str] = None, **engine_kwargs: Any) -> None:
+        self.primary = create_engine_for(primary_url, **engine_kwargs)
+        self.replica = (
+            create_engine_for(replica_url, **engine_kwargs) if replica_url else self.primary
+        )
+        self.write_sessions = async_sessionmaker(
+            self.primary,
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
+        self.read_sessions = async_sessionmaker(
+            self.replica,
+            class_=AsyncSession,
+            sync_session_class=ReadOnlySession,
+            expire_on_commit=False,
+        )
+
+    def session(self, readonly: bool = False) -> AsyncSession:
+        """New session on the replica if ``readonly`` else on the primary"""
+        return self.read_sessions() if readonly else self.write_sessions()
+
+    def pool_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Pool metrics per route"""
+        metrics = {"primary": self.primary.sync_engine.pool.snapshot()}
+        if self.replica is not self.primary:
+            metrics["replica"] = self.replica.sync_engine.pool.snapshot()
+        return metrics
+
+    async def dispose(self) -> None:
+        await self.primary.dispose()
+        if self.replica is not self.primary:
+            await self.replica.dispose()
+
+
+db = DatabaseRouter(settings.DATABASE_URL, settings.DATABASE_REPLICA_URL or None)
+
+# Primary engine and session factory
+engine = db.primary
+AsyncSessionLocal = db.write_sessions
+
+# Replica session factory for listings, analytics and action generation
+ReadSessionLocal = db.read_sessions
+
 # Base class for models
 Base = declarative_base()
 
@@ -30,7 +181,7 @@ Base = declarative_base()
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for getting async database sessions.
-    
+
     Usage in FastAPI:
         @app.get("/items")
         async def read_items(db: AsyncSession = Depends(get_db)):
@@ -43,9 +194,16 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for read-only sessions, served by the replica when configured"""
+    async with ReadSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
 async def init_db() -> None:
     """Initialize database tables"""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-
-
@@ -0,0 +1,71 @@
+"""Pub/sub event bus for realtime campaign updates"""
+import asyncio
+import json
+from collections import defaultdict
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+from .config import settings
+
+
+def campaign_status_channel(campaign_id: str) -> str:
+    """Channel the send engine publishes campaign progress to"""
+    return f"campaign:{campaign_id}:status"
+
+
+class InProcessEventBus:
+    """Event bus backed by asyncio queues; only reaches subscribers in this process"""
+
+    def __init__(self) -> None:
+        self._queues: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+
+    async def publish(self, channel: str, event: Dict[str, Any]) -> None:
+        for queue in self._queues.get(channel, ()):
+            queue.put_nowait(event)
+
+    async def subscribe(self, channel: str) -> AsyncIterator[Dict[str, Any]]:
+        queue: asyncio.Queue = asyncio.Queue()
+        self._queues[channel].add(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._queues[channel].discard(queue)
+            if not self._queues[channel]:
+                del self._queues[channel]
+
+
+class RedisEventBus:
+    """Event bus backed by Redis pub/sub so CLI and worker senders reach the API"""
+
+    def __init__(self, url: str) -> None:
+        import redis.asyncio as redis
+
+        self._client = redis.Redis.from_url(url)
+
+    async def publish(self, channel: str, event: Dict[str, Any]) -> None:
+        await self._client.publish(channel, json.dumps(event))
+
+    async def subscribe(self, channel: str) -> AsyncIterator[Dict[str, Any]]:
+        pubsub = self._client.pubsub()
+        await pubsub.subscribe(channel)
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    yield json.loads(message["data"])
+        finally:
+            await pubsub.unsubscribe(channel)
+            await pubsub.close()
+
+
+_bus: Optional[Any] = None
+
+
+def get_event_bus():
+    """Dependency returning the process-wide event bus"""
+    global _bus
+    if _bus is None:
+        if settings.EVENT_BUS == "memory":
+            _bus = InProcessEventBus()
+        else:
+            _bus = RedisEventBus(settings.REDIS_URL)
+    return _bus
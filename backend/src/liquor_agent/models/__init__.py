@@ -1,7 +1,14 @@
 """SQLAlchemy models"""
 from .user import User
 from .customer import Customer
+from .rollup import CustomerRollup, CustomerRollupContribution, RollupWatermark
 
-__all__ = ["User", "Customer"]
+__all__ = [
+    "User",
+    "Customer",
+    "CustomerRollup",
+    "CustomerRollupContribution",
+    "RollupWatermark",
+]
 
 
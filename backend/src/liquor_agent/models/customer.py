@@ -1,16 +1,21 @@
 """Customer model"""
 from typing import Optional
-from sqlalchemy import Column, String, Integer, Numeric, Boolean, DateTime
+from sqlalchemy import JSON, Column, String, Integer, Numeric, Boolean, DateTime, Index
 from sqlalchemy.dialects.postgresql import JSONB, ARRAY
 from sqlalchemy.orm import Mapped
 
 from ..core.database import Base
 from .base import TimestampMixin, UUIDMixin
 
+# JSONB on PostgreSQL, plain JSON elsewhere (e.g. SQLite in tests)
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
 
 class Customer(Base, UUIDMixin, TimestampMixin):
     """Customer model with segmentation and behavioral data"""
     __tablename__ = "customers"
+    # Rollup refresh scans customers changed since its last watermark
+    __table_args__ = (Index("ix_customers_updated_at", "updated_at"),)
     
     # Basic info
     email: Mapped[str] = Column(String(255), unique=True, nullable=False, index=True)
@@ -35,10 +40,10 @@ class Customer(Base, UUIDMixin, TimestampMixin):
     # Product preferences
     primary_category: Mapped[Optional[str]] = Column(String(100), nullable=True, index=True)
     secondary_category: Mapped[Optional[str]] = Column(String(100), nullable=True)
-    favorite_brands: Mapped[Optional[list]] = Column(JSONB, nullable=True)
+    favorite_brands: Mapped[Optional[list]] = Column(JSONType, nullable=True)
     
     # Metadata
-    raw_data: Mapped[Optional[dict]] = Column(JSONB, nullable=True)
+    raw_data: Mapped[Optional[dict]] = Column(JSONType, nullable=True)
     last_purchase_at: Mapped[Optional[DateTime]] = Column(DateTime, nullable=True)
     deleted_at: Mapped[Optional[DateTime]] = Column(DateTime, nullable=True)  # Soft delete
     
@@ -0,0 +1,63 @@
+"""Pre-aggregated customer analytics rollups"""
+from datetime import date, datetime
+from typing import Optional
+from sqlalchemy import Column, Date, DateTime, Integer, Numeric, String
+from sqlalchemy.orm import Mapped
+
+from ..core.database import Base
+from .base import UUIDMixin
+
+
+class CustomerRollup(Base):
+    """
+    Customer metrics summed per (day, rfm_segment, primary_category).
+
+    ``day`` is the customer's last purchase date (created date if they never
+    purchased). Dashboards sum a handful of these rows instead of scanning
+    ``customers``; averages are derived from the stored sums and counts.
+    """
+    __tablename__ = "customer_rollups"
+    
+    day: Mapped[date] = Column(Date, primary_key=True)
+    rfm_segment: Mapped[str] = Column(String(100), primary_key=True)
+    primary_category: Mapped[str] = Column(String(100), primary_key=True)
+    
+    customers: Mapped[int] = Column(Integer, default=0, nullable=False)
+    total_spent: Mapped[float] = Column(Numeric(16, 2), default=0, nullable=False)
+    avg_order_value_sum: Mapped[float] = Column(Numeric(16, 2), default=0, nullable=False)
+    clv_sum: Mapped[float] = Column(Numeric(16, 2), default=0, nullable=False)
+    clv_count: Mapped[int] = Column(Integer, default=0, nullable=False)
+    churn_high: Mapped[int] = Column(Integer, default=0, nullable=False)
+    churn_medium: Mapped[int] = Column(Integer, default=0, nullable=False)
+    churn_low: Mapped[int] = Column(Integer, default=0, nullable=False)
+
+
+class CustomerRollupContribution(Base, UUIDMixin):
+    """
+    What each customer last added to ``customer_rollups``.
+
+    Lets a refresh subtract a changed customer's old contribution before
+    adding the new one, so updates are applied as exact deltas.
+    """
+    __tablename__ = "customer_rollup_contributions"
+    
+    day: Mapped[date] = Column(Date, nullable=False)
+    rfm_segment: Mapped[str] = Column(String(100), nullable=False)
+    primary_category: Mapped[str] = Column(String(100), nullable=False)
+    total_spent: Mapped[float] = Column(Numeric(10, 2), nullable=False)
+    avg_order_value: Mapped[float] = Column(Numeric(10, 2), nullable=False)
+    clv_score: Mapped[Optional[float]] = Column(Numeric(10, 2), nullable=True)
+    churn_risk: Mapped[Optional[str]] = Column(String(50), nullable=True)
+
+
+class RollupWatermark(Base):
+    """
+    Highest ``customers.updated_at`` folded into the rollups.
+
+    The row is also the lock refreshes take; ``updated_at`` is NULL until the
+    first refresh has seen a customer.
+    """
+    __tablename__ = "rollup_watermarks"
+    
+    name: Mapped[str] = Column(String(50), primary_key=True)
+    updated_at: Mapped[Optional[datetime]] = Column(DateTime, nullable=True)
@@ -0,0 +1,277 @@
+"""Dashboard analytics backed by incrementally maintained rollups"""
+from collections import defaultdict
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import Date, and_, delete, func, insert, or_, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import Customer, CustomerRollup, CustomerRollupContribution, RollupWatermark
+
+ROLLUP_NAME = "customer_rollups"
+UNKNOWN = "Unknown"
+
+# Re-scan this far behind the watermark so rows committed late with an older
+# updated_at are still picked up; re-applying a customer is a no-op.
+# updated_at is stamped when the writer flushes, not when it commits, so a
+# writer transaction left open longer than the overlap is missed for good
+# (until a full rebuild). Pass a larger ``overlap`` to refresh_rollups() if
+# long-running writers are expected.
+REFRESH_OVERLAP = timedelta(minutes=5)
+
+RollupKey = Tuple[date, str, str]
+
+_ZERO = Decimal("0")
+_MEASURES = (
+    "customers", "total_spent", "avg_order_value_sum", "clv_sum",
+    "clv_count", "churn_high", "churn_medium", "churn_low",
+)
+
+
+def _rollup_key(row: Any) -> RollupKey:
+    day = (row.last_purchase_at or row.created_at).date()
+    return day, row.rfm_segment or UNKNOWN, row.primary_category or UNKNOWN
+
+
+def _add(delta: Dict[str, Any], row: Any, sign: int) -> None:
+    """Add (sign=1) or remove (sign=-1) one customer's metrics from ``delta``"""
+    delta["customers"] += sign
+    delta["total_spent"] += sign * (row.total_spent or _ZERO)
+    delta["avg_order_value_sum"] += sign * (row.avg_order_value or _ZERO)
+    if row.clv_score is not None:
+        delta["clv_sum"] += sign * row.clv_score
+        delta["clv_count"] += sign
+    churn = (row.churn_risk or "").lower()
+    if churn in ("high", "medium", "low"):
+        delta[f"churn_{churn}"] += sign
+
+
+def _empty_delta() -> Dict[str, Any]:
+    return {m: 0 for m in _MEASURES}
+
+
+async def _apply_batch(session: AsyncSession, rows: List[Any]) -> None:
+    Contribution = CustomerRollupContribution
+    result = await session.execute(
+        select(
+            Contribution.id, Contribution.day, Contribution.rfm_segment,
+            Contribution.primary_category, Contribution.total_spent,
+            Contribution.avg_order_value, Contribution.clv_score, Contribution.churn_risk,
+        ).where(Contribution.id.in_([r.id for r in rows]))
+    )
+    previous = {c.id: c for c in result}
+
+    deltas: Dict[RollupKey, Dict[str, Any]] = defaultdict(_empty_delta)
+    inserts: List[Dict[str, Any]] = []
+    updates: List[Dict[str, Any]] = []
+    deletes: List[Any] = []
+    for row in rows:
+        prev = previous.get(row.id)
+        if prev is not None:
+            _add(deltas[(prev.day, prev.rfm_segment, prev.primary_category)], prev, -1)
+        if row.deleted_at is not None:
+            if prev is not None:
+                deletes.append(row.id)
+            continue
+        key = _rollup_key(row)
+        _add(deltas[key], row, 1)
+        (updates if prev is not None else inserts).append({
+            "id": row.id,
+            "day": key[0],
+            "rfm_segment": key[1],
+            "primary_category": key[2],
+            "total_spent": row.total_spent or _ZERO,
+            "avg_order_value": row.avg_order_value or _ZERO,
+            "clv_score": row.clv_score,
+            "churn_risk": row.churn_risk,
+        })
+    if inserts:
+        await session.execute(insert(Contribution), inserts)
+    if updates:
+        await session.execute(update(Contribution), updates)
+    if deletes:
+        await session.execute(delete(Contribution).where(Contribution.id.in_(deletes)))
+
+    keys = list(deltas)
+    result = await session.execute(
+        select(CustomerRollup).where(
+            tuple_(
+                CustomerRollup.day, CustomerRollup.rfm_segment, CustomerRollup.primary_category
+            ).in_(keys)
+        )
+    )
+    existing = {(r.day, r.rfm_segment, r.primary_category): r for r in result.scalars()}
+    for key, delta in deltas.items():
+        rollup = existing.get(key)
+        if rollup is None:
+            rollup = CustomerRollup(day=key[0], rfm_segment=key[1], primary_category=key[2])
+            for m in _MEASURES:
+                setattr(rollup, m, 0)
+            session.add(rollup)
+        for m in _MEASURES:
+            setattr(rollup, m, getattr(rollup, m) + delta[m])
+        if rollup.customers == 0:
+            await session.delete(rollup)
+    await session.flush()
+
+
+def _watermark_query():
+    return (
+        select(RollupWatermark)
+        .where(RollupWatermark.name == ROLLUP_NAME)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+
+
+async def _lock_watermark(session: AsyncSession) -> RollupWatermark:
+    """Lock (creating on first use) the watermark row for this transaction"""
+    watermark = (await session.execute(_watermark_query())).scalar_one_or_none()
+    if watermark is None:
+        try:
+            async with session.begin_nested():
+                session.add(RollupWatermark(name=ROLLUP_NAME, updated_at=None))
+        except IntegrityError:
+            pass  # another refresh created it first
+        watermark = (await session.execute(_watermark_query())).scalar_one()
+    return watermark
+
+
+async def refresh_rollups(
+    session: AsyncSession,
+    batch_size: int = 5000,
+    overlap: timedelta = REFRESH_OVERLAP,
+) -> int:
+    """
+    Fold customers changed since the last refresh into ``customer_rollups``.
+
+    The first call backfills from the whole table; later calls only read rows
+    whose ``updated_at`` is past the stored watermark. Returns the number of
+    customer rows processed.
+
+    The whole refresh runs in one transaction holding ``SELECT ... FOR UPDATE``
+    on the watermark row, so concurrent refreshes (cron plus a manual run)
+    queue up instead of racing on the rollup rows.
+    """
+    watermark = await _lock_watermark(session)
+    since = watermark.updated_at - overlap if watermark.updated_at else None
+    newest = watermark.updated_at
+
+    cols = (
+        Customer.id, Customer.updated_at, Customer.created_at, Customer.last_purchase_at,
+        Customer.deleted_at, Customer.rfm_segment, Customer.primary_category,
+        Customer.total_spent, Customer.avg_order_value, Customer.clv_score, Customer.churn_risk,
+    )
+    processed = 0
+    last: Optional[Tuple[Any, Any]] = None
+    while True:
+        query = select(*cols).order_by(Customer.updated_at, Customer.id).limit(batch_size)
+        if since is not None:
+            query = query.where(Customer.updated_at >= since)
+        if last is not None:
+            query = query.where(
+                or_(
+                    Customer.updated_at > last[0],
+                    and_(Customer.updated_at == last[0], Customer.id > last[1]),
+                )
+            )
+        rows = (await session.execute(query)).all()
+        if not rows:
+            break
+        await _apply_batch(session, rows)
+        processed += len(rows)
+        last = (rows[-1].updated_at, rows[-1].id)
+        newest = last[0] if newest is None else max(newest, last[0])
+
+    watermark.updated_at = newest
+    await session.commit()
+    return processed
+
+
+def _summarize(rows: Iterable[Any], start: date, end: date, top: int) -> Dict[str, Any]:
+    totals = _empty_delta()
+    by_day: Dict[str, float] = defaultdict(float)
+    by_segment: Dict[str, Dict[str, Any]] = defaultdict(
+        lambda: {"lifetime_spend": 0.0, "customers": 0}
+    )
+    for r in rows:
+        for m in _MEASURES:
+            totals[m] += getattr(r, m) or 0
+        spend = float(r.total_spent or 0)
+        by_day[str(r.day)] += spend
+        seg = by_segment[r.rfm_segment]
+        seg["lifetime_spend"] += spend
+        seg["customers"] += r.customers
+
+    customers = totals["customers"]
+    top_segments = sorted(
+        by_segment.items(), key=lambda kv: kv[1]["lifetime_spend"], reverse=True
+    )
+    return {
+        "period": f"{start} to {end}",
+        "kpis": {
+            "active_customers": customers,
+            "lifetime_spend_of_active_customers": round(float(totals["total_spent"]), 2),
+            "avg_customer_order_value": round(float(totals["avg_order_value_sum"]) / customers, 2)
+            if customers else 0.0,
+            "avg_clv": round(float(totals["clv_sum"]) / totals["clv_count"], 2)
+            if totals["clv_count"] else None,
+            "churn_risk_high": totals["churn_high"],
+            "churn_risk_medium": totals["churn_medium"],
+            "churn_risk_low": totals["churn_low"],
+        },
+        "lifetime_spend_by_last_purchase_day": [
+            {"date": day, "lifetime_spend": round(spend, 2)}
+            for day, spend in sorted(by_day.items())
+        ],
+        "top_segments": [
+            {"segment": seg, "lifetime_spend": round(v["lifetime_spend"], 2),
+             "customers": v["customers"]}
+            for seg, v in top_segments[:top]
+        ],
+    }
+
+
+async def dashboard_kpis(
+    session: AsyncSession, start: date, end: date, top: int = 5
+) -> Dict[str, Any]:
+    """
+    Dashboard KPIs for customers whose last purchase falls between ``start`` and ``end``.
+
+    Read from the rollups. ``customers`` only carries lifetime totals, so the
+    spend figures are each active customer's *lifetime* ``total_spent``,
+    grouped by their last-purchase day. They are not revenue earned in the
+    period or on that day: a customer who buys again moves their whole
+    lifetime spend to the new day. Per-period revenue needs order-level data.
+    """
+    result = await session.execute(
+        select(CustomerRollup).where(CustomerRollup.day.between(start, end))
+    )
+    return _summarize(result.scalars(), start, end, top)
+
+
+async def dashboard_kpis_raw(
+    session: AsyncSession, start: date, end: date, top: int = 5
+) -> Dict[str, Any]:
+    """Same as :func:`dashboard_kpis` but aggregated from ``customers`` (reference/benchmark)"""
+    day = func.date(func.coalesce(Customer.last_purchase_at, Customer.created_at), type_=Date)
+    churn = func.lower(Customer.churn_risk)
+    query = (
+        select(
+            day.label("day"),
+            func.coalesce(Customer.rfm_segment, UNKNOWN).label("rfm_segment"),
+            func.count().label("customers"),
+            func.sum(Customer.total_spent).label("total_spent"),
+            func.sum(Customer.avg_order_value).label("avg_order_value_sum"),
+            func.sum(Customer.clv_score).label("clv_sum"),
+            func.count(Customer.clv_score).label("clv_count"),
+            func.count().filter(churn == "high").label("churn_high"),
+            func.count().filter(churn == "medium").label("churn_medium"),
+            func.count().filter(churn == "low").label("churn_low"),
+        )
+        .where(Customer.deleted_at.is_(None), day.between(start, end))
+        .group_by(day, func.coalesce(Customer.rfm_segment, UNKNOWN))
+    )
+    return _summarize((await session.execute(query)).all(), start, end, top)
@@ -0,0 +1,23 @@
+"""Shared pytest fixtures"""
+from typing import AsyncGenerator
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from liquor_agent.core.database import Base
+import liquor_agent.models  # noqa: F401  (register tables on Base.metadata)
+
+
+@pytest.fixture
+async def db_engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def db_session(db_engine) -> AsyncGenerator[AsyncSession, None]:
+    async with async_sessionmaker(db_engine, expire_on_commit=False)() as session:
+        yield session
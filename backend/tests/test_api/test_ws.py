@@ -0,0 +1,85 @@
+"""Tests for campaign status WebSocket fan-out"""
+import asyncio
+import json
+
+from liquor_agent.api.ws import CampaignStatusHub, coalesce
+from liquor_agent.core.events import InProcessEventBus, campaign_status_channel
+
+
+def _send(i: int, status: str = "sent") -> dict:
+    return {
+        "event": "send_completed",
+        "campaign_id": "c1",
+        "status": status,
+        "progress": {"completed": i, "total": 10, "percentage": i * 10.0},
+    }
+
+
+class FakeSocket:
+    def __init__(self, delay: float = 0) -> None:
+        self.messages = []
+        self.closed_with = None
+        self.delay = delay
+
+    async def send_text(self, text: str) -> None:
+        await asyncio.sleep(self.delay)
+        self.messages.append(json.loads(text))
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed_with = code
+
+
+class BrokenBus:
+    async def subscribe(self, channel: str):
+        raise ConnectionError("redis unavailable")
+        yield  # pragma: no cover
+
+
+def test_coalesce_keeps_lifecycle_and_latest_progress():
+    started = {"event": "campaign_started", "campaign_id": "c1"}
+    done = {"event": "campaign_completed", "campaign_id": "c1"}
+    events = [started, _send(1), _send(2, "failed"), _send(3), done]
+    out = coalesce(events)
+    assert [e["event"] for e in out] == ["campaign_started", "send_completed", "campaign_completed"]
+    assert out[1]["progress"]["completed"] == 3
+    assert out[1]["batch"] == {"sent": 2, "failed": 1, "skipped": 0}
+
+
+async def test_hub_batches_per_tick_for_all_sockets():
+    bus = InProcessEventBus()
+    hub = CampaignStatusHub(bus, "c1", tick=0.05)
+    sockets = [FakeSocket(), FakeSocket()]
+    hub.sockets.update(sockets)
+    hub.start()
+    await asyncio.sleep(0.01)  # let the hub subscribe
+    for i in range(1, 11):
+        await bus.publish(campaign_status_channel("c1"), _send(i))
+    await asyncio.sleep(0.1)
+    await hub.stop()
+    for ws in sockets:
+        assert len(ws.messages) == 1
+        assert ws.messages[0]["events"][0]["batch"] == {"sent": 10, "failed": 0, "skipped": 0}
+
+
+async def test_slow_socket_is_dropped_without_stalling_others():
+    bus = InProcessEventBus()
+    hub = CampaignStatusHub(bus, "c1", tick=0.05)
+    fast, slow = FakeSocket(), FakeSocket(delay=1)
+    hub.sockets.update([fast, slow])
+    hub.start()
+    await asyncio.sleep(0.01)
+    await bus.publish(campaign_status_channel("c1"), _send(1))
+    await asyncio.sleep(0.15)
+    await hub.stop()
+    assert len(fast.messages) == 1
+    assert slow not in hub.sockets and slow.closed_with == 1013
+
+
+async def test_hub_failure_closes_sockets():
+    hub = CampaignStatusHub(BrokenBus(), "c1", tick=0.05)
+    ws = FakeSocket()
+    hub.sockets.add(ws)
+    hub.start()
+    await asyncio.sleep(0.05)
+    assert ws.closed_with == 1011
+    assert not hub.sockets
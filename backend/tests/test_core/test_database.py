@@ -0,0 +1,88 @@
+"""Tests for primary/replica session routing and pool metrics"""
+import asyncio
+
+import pytest
+from sqlalchemy import func, insert, select, text, update
+
+from liquor_agent.core.config import settings
+from liquor_agent.core.database import Base, DatabaseRouter, create_engine_for
+from liquor_agent.models import Customer
+
+
+@pytest.fixture
+async def router(tmp_path):
+    primary_url = f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}"
+    replica_url = f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}"
+    router = DatabaseRouter(primary_url, replica_url, pool_size=1, max_overflow=1)
+    for engine in (router.primary, router.replica):
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    yield router
+    await router.dispose()
+
+
+async def _count(session) -> int:
+    return (await session.execute(select(func.count()).select_from(Customer))).scalar_one()
+
+
+async def test_reads_go_to_replica_writes_to_primary(router):
+    async with router.session() as session:
+        session.add(Customer(email="a@example.com", name="A"))
+        await session.commit()
+        assert await _count(session) == 1
+
+    async with router.session(readonly=True) as session:
+        assert await _count(session) == 0  # replica hasn't caught up
+
+    async with router.replica.begin() as conn:
+        await conn.execute(
+            text("INSERT INTO customers (id, email, name, is_night_buyer, purchase_frequency,"
+                 " total_spent, avg_order_value, created_at, updated_at)"
+                 " VALUES ('1', 'a@example.com', 'A', 0, 0, 0, 0, '2025-01-01', '2025-01-01')")
+        )
+    async with router.session(readonly=True) as session:
+        assert await _count(session) == 1
+
+
+async def test_read_session_rejects_writes(router):
+    async with router.session(readonly=True) as session:
+        session.add(Customer(email="b@example.com", name="B"))
+        with pytest.raises(RuntimeError, match="read-only"):
+            await session.flush()
+
+
+@pytest.mark.parametrize("statement", [
+    insert(Customer).values(email="c@example.com", name="C"),
+    update(Customer).values(name="X"),
+    text("  UPDATE customers SET name = 'X'"),
+])
+async def test_read_session_rejects_core_writes(router, statement):
+    async with router.session(readonly=True) as session:
+        with pytest.raises(RuntimeError, match="read-only"):
+            await session.execute(statement)
+        assert await _count(session) == 0  # plain reads still work
+
+
+async def test_pool_metrics_track_checkout_wait_and_overflow(router):
+    async def hold(seconds: float) -> None:
+        async with router.primary.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            await asyncio.sleep(seconds)
+
+    # pool_size=1 + max_overflow=1: two holders use the overflow slot, a third waits
+    await asyncio.gather(hold(0.1), hold(0.1), hold(0))
+    metrics = router.pool_metrics()
+    primary = metrics["primary"]
+    assert set(metrics) == {"primary", "replica"}
+    assert primary["checked_out"] == 0
+    assert primary["checkouts"] >= 3
+    assert primary["overflow_peak"] == 1
+    assert primary["wait_seconds_max"] >= 0.05
+
+
+def test_asyncpg_statement_cache_configured():
+    engine = create_engine_for("postgresql://u:p@localhost/db")
+    assert engine.url.drivername == "postgresql+asyncpg"
+    assert engine.url.password == "p"
+    assert engine.url.query["prepared_statement_cache_size"] == str(settings.DATABASE_STATEMENT_CACHE_SIZE)
+    assert engine.sync_engine.pool._pre_ping is settings.DATABASE_POOL_PRE_PING
@@ -0,0 +1,80 @@
+"""Tests for rollup-backed dashboard analytics"""
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy.dialects import postgresql
+
+from liquor_agent.models import Customer
+from liquor_agent.services.analytics_service import (
+    _watermark_query,
+    dashboard_kpis,
+    dashboard_kpis_raw,
+    refresh_rollups,
+)
+
+START, END = date(2025, 10, 1), date(2025, 10, 31)
+
+
+def _customer(i: int, **kw) -> Customer:
+    defaults = dict(
+        email=f"c{i}@example.com",
+        name=f"C{i}",
+        rfm_segment=["Low_Value_Frequent", "At_Risk"][i % 2],
+        churn_risk=["high", "low", "medium"][i % 3],
+        primary_category=["Vodka", "Wine"][i % 2],
+        clv_score=Decimal(100 + i) if i % 4 else None,
+        total_spent=Decimal(10 * i),
+        avg_order_value=Decimal(5 + i),
+        last_purchase_at=datetime(2025, 10, 1 + i % 5),
+        updated_at=datetime(2025, 10, 20) + timedelta(seconds=i),
+    )
+    defaults.update(kw)
+    return Customer(**defaults)
+
+
+async def test_rollups_match_raw_aggregation_after_incremental_updates(db_session):
+    customers = [_customer(i) for i in range(20)]
+    db_session.add_all(customers)
+    await db_session.commit()
+    assert await refresh_rollups(db_session, batch_size=7) == 20
+    assert await dashboard_kpis(db_session, START, END) == await dashboard_kpis_raw(
+        db_session, START, END
+    )
+
+    later = datetime(2025, 10, 21)
+    customers[0].rfm_segment, customers[0].updated_at = "Champions_High_Value", later
+    customers[1].total_spent, customers[1].updated_at = Decimal("999.00"), later
+    customers[2].deleted_at, customers[2].updated_at = later, later
+    db_session.add(_customer(99, updated_at=later))
+    await db_session.commit()
+
+    # Only the 4 changed rows plus the one sitting on the watermark are re-read.
+    assert await refresh_rollups(db_session, overlap=timedelta(0)) == 5
+    rolled = await dashboard_kpis(db_session, START, END)
+    assert rolled == await dashboard_kpis_raw(db_session, START, END)
+    assert rolled["kpis"]["active_customers"] == 20
+    assert await refresh_rollups(db_session, overlap=timedelta(0)) == 4  # idempotent
+    assert await dashboard_kpis(db_session, START, END) == rolled
+
+
+def test_refresh_locks_watermark_row():
+    sql = str(_watermark_query().compile(dialect=postgresql.dialect()))
+    assert "FOR UPDATE" in sql
+
+
+async def test_spend_is_lifetime_total_on_last_purchase_day(db_session):
+    customer = _customer(1, total_spent=Decimal("10000"), last_purchase_at=datetime(2025, 10, 2))
+    db_session.add(customer)
+    await db_session.commit()
+    await refresh_rollups(db_session)
+
+    customer.total_spent = Decimal("10050")
+    customer.last_purchase_at = customer.updated_at = datetime(2025, 10, 25)
+    await db_session.commit()
+    await refresh_rollups(db_session)
+
+    kpis = await dashboard_kpis(db_session, START, END)
+    assert kpis["lifetime_spend_by_last_purchase_day"] == [
+        {"date": "2025-10-25", "lifetime_spend": 10050.0}
+    ]
+    assert kpis["kpis"]["lifetime_spend_of_active_customers"] == 10050.0
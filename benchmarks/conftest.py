@@ -0,0 +1,25 @@
+import os
+
+import pytest
+
+from liquor_agent.synth import generate_kb, write_kb
+
+# BENCH_SCALE=10000,1000000 python -m pytest benchmarks --benchmark-autosave
+SCALES = [int(s) for s in os.getenv("BENCH_SCALE", "10000").split(",")]
+
+
+@pytest.fixture(scope="session", params=SCALES, ids=lambda n: f"n={n}")
+def scale(request):
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def customers(scale):
+    return generate_kb(scale)
+
+
+@pytest.fixture(scope="session")
+def kb_path(scale, tmp_path_factory):
+    path = tmp_path_factory.mktemp("kb") / f"kb_{scale}.json"
+    write_kb(path, scale)
+    return path
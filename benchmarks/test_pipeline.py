@@ -0,0 +1,68 @@
+import contextlib
+import json
+import os
+
+from liquor_agent.dataio import read_json
+from liquor_agent.offers import OfferResolver
+from liquor_agent.orchestrator import heuristic_plan
+from liquor_agent.pusher import render_email_html, render_sms, render_subject
+from liquor_agent.records import Send, actions_from_dicts, to_jsonable
+from liquor_agent.sender import send_items
+from liquor_agent.subagent import build_actions, nudge, score
+
+
+def _stub_email(to_email, subject, html, text=None):
+    return {"status_code": 200}
+
+
+def _stub_sms(to_number, body):
+    return {"sid": "stub"}
+
+
+def test_load(benchmark, kb_path):
+    benchmark.pedantic(read_json, args=(kb_path,), rounds=3)
+
+
+def test_score(benchmark, customers):
+    benchmark(lambda: [score(r) for r in customers])
+
+
+def test_rank(benchmark, customers):
+    benchmark(build_actions, customers, 300)
+
+
+def test_nudge(benchmark, customers):
+    benchmark(lambda: [nudge(r) for r in customers])
+
+
+def test_resolve_offers_batch(benchmark, customers):
+    playbook = os.path.join(os.path.dirname(__file__), "..", "sample_data", "segment_playbooks.json")
+    offers = OfferResolver(read_json(playbook))
+    segments = [r["segmentation"]["rfm_segment"] for r in customers]
+    churns = [r["segmentation"]["churn_risk"] for r in customers]
+    categories = [r["product_preferences"]["primary_category"] for r in customers]
+    benchmark(offers.resolve_batch, segments, churns, categories)
+
+
+def test_plan(benchmark, customers):
+    # heuristic_plan keeps the first 200 actions, so time what orchestrator.main
+    # does with the whole actions file: parse every action, then plan.
+    rows = json.loads(json.dumps(build_actions(customers, limit=len(customers)), default=to_jsonable))
+    benchmark(lambda: heuristic_plan(actions_from_dicts(rows)))
+
+
+def test_render(benchmark, customers):
+    actions = build_actions(customers, limit=len(customers))
+    benchmark(lambda: [(render_subject(a), render_email_html(a), render_sms(a)) for a in actions])
+
+
+def test_send_stubbed(benchmark, customers):
+    # Built directly rather than via heuristic_plan (capped at 200), with
+    # phones so the SMS path runs too.
+    sends = [
+        Send.create("2025-10-20", a.email, a.channel, a.send_window, a.offer, a.creative_hint,
+                    a.segment, phone=f"+1555{i:07d}")
+        for i, a in enumerate(build_actions(customers, limit=len(customers)))
+    ]
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        benchmark(send_items, sends, "both", _stub_email, _stub_sms, 0)
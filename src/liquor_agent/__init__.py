@@ -1 +1 @@
-__all__=['subagent','orchestrator','dataio','llm_openai','config','pusher','sender']
+__all__=['subagent','orchestrator','dataio','llm_openai','config','pusher','sender','records','synth','progress','offers']
@@ -1,9 +1,10 @@
 import json
 from pathlib import Path
+from .records import to_jsonable
 
 def read_json(p):
     return json.load(open(p))
 
 def write_json(p, obj):
     Path(p).parent.mkdir(parents=True, exist_ok=True)
-    json.dump(obj, open(p,'w'), indent=2)
+    json.dump(obj, open(p,'w'), indent=2, default=to_jsonable)
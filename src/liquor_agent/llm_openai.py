@@ -1,10 +1,11 @@
 from typing import Any, Dict, List, Optional
 from .config import settings
+from .records import to_jsonable
 
 def plan_with_openai(system_prompt: str,
                      user_prompt: str,
                      context_docs: List[Dict[str, str]],
-                     actions: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+                     actions: List[Any]) -> Optional[Dict[str, Any]]:
     # If no key, fall back to heuristic (caller handles None)
     if not settings.openai_api_key:
         return None
@@ -30,7 +31,7 @@ def plan_with_openai(system_prompt: str,
             input=[
                 {"role": "system", "content": sys_msg},
                 {"role": "user", "content": user_prompt},
-                {"role": "tool", "content": "json:" + json.dumps(tool_blob)},
+                {"role": "tool", "content": "json:" + json.dumps(tool_blob, default=to_jsonable)},
             ],
             response_format={"type": "json_object"},
         )
@@ -0,0 +1,168 @@
+import logging
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .dataio import read_json
+from .records import shared
+
+# Built-in rules; a playbook's "rules" and per-segment "recommended_offers"
+# are layered on top. Precedence: built-in segment rules > playbook segments
+# with "override_churn": true > churn > playbook segments > category > default.
+DEFAULT_RULES: Dict[str, Any] = {
+    "default": "Discovery pack 3-for-2",
+    "churn": {"high": "20% win-back discount"},
+    # substring of the lower-cased primary category -> offer, first match wins
+    "categories": {
+        "tequila": "Premium bundle 15% off",
+        "whiskey": "Premium bundle 15% off",
+        "rum": "Value bundle $50+ free delivery",
+        "vodka": "Value bundle $50+ free delivery",
+        "beer": "Value bundle $50+ free delivery",
+        "wine": "Value bundle $50+ free delivery",
+    },
+    # substring of the RFM segment -> offer, first match wins
+    "segments": {"Low_Value_Frequent": "Bundle uplift: buy 2 get 10% off"},
+}
+
+# Distinct (segment, churn, category) triples are few in practice; the cap
+# only guards against free-text categories growing the table forever.
+MAX_TABLE_SIZE = 100_000
+
+Key = Tuple[str, str, str]
+
+log = logging.getLogger(__name__)
+
+
+class _DecisionTable:
+    """Playbook rules compiled once; each distinct input triple is decided once."""
+
+    def __init__(self, playbook: Dict[str, Any]):
+        rules = playbook.get("rules", {}) or {}
+        self.default = shared(rules.get("default", DEFAULT_RULES["default"]))
+        churn = {**DEFAULT_RULES["churn"], **(rules.get("churn") or {})}
+        self.churn = {k.lower(): shared(v) for k, v in churn.items()}
+        categories = {**DEFAULT_RULES["categories"], **(rules.get("categories") or {})}
+        self.categories = [(k.lower(), shared(v)) for k, v in categories.items()]
+        rules_by_segment = dict(DEFAULT_RULES["segments"])
+        # Playbook segments are matched by exact name. A playbook offer for a
+        # built-in rule's segment just replaces that rule's offer.
+        self.segment_overrides: Dict[str, str] = {}
+        self.segment_offers: Dict[str, str] = {}
+        for name, spec in (playbook.get("segments") or {}).items():
+            spec = spec or {}
+            offers = spec.get("recommended_offers") or []
+            if not offers:
+                continue
+            if name in rules_by_segment:
+                rules_by_segment[name] = offers[0]
+            elif spec.get("override_churn"):
+                self.segment_overrides[name] = shared(offers[0])
+            else:
+                self.segment_offers[name] = shared(offers[0])
+        self.segment_rules = [(k, shared(v)) for k, v in rules_by_segment.items()]
+        self.rows: Dict[Key, str] = {}
+
+    def decide(self, segment: str, churn: str, category: str) -> str:
+        segment = segment or ""
+        for name, offer in self.segment_rules:
+            if name in segment:
+                return offer
+        offer = self.segment_overrides.get(segment)
+        if offer:
+            return offer
+        offer = self.churn.get((churn or "").lower())
+        if offer:
+            return offer
+        offer = self.segment_offers.get(segment)
+        if offer:
+            return offer
+        category = (category or "").lower()
+        for keyword, offer in self.categories:
+            if keyword in category:
+                return offer
+        return self.default
+
+    def lookup(self, key: Key) -> str:
+        # Missing values from columnar inputs (None, NaN) match like "".
+        key = tuple(v if isinstance(v, str) else "" for v in key)
+        offer = self.rows.get(key)
+        if offer is None:
+            if len(self.rows) >= MAX_TABLE_SIZE:
+                self.rows.clear()
+            offer = self.rows[key] = self.decide(*key)
+        return offer
+
+
+class OfferResolver:
+    """Resolves a customer's offer from (segment, churn risk, primary category).
+
+    Built from a segment_playbooks.json blob; with ``from_file`` the playbook
+    is re-read when the file changes (checked at most every ``check_interval``
+    seconds).
+    """
+
+    def __init__(self, playbook: Optional[Dict[str, Any]] = None,
+                 path: Optional[str] = None, check_interval: float = 5.0):
+        self.path = path
+        self.check_interval = check_interval
+        self._mtime = os.stat(path).st_mtime if path else None
+        self._checked_at = time.monotonic()
+        self._table = _DecisionTable(playbook or {})
+
+    @classmethod
+    def from_file(cls, path, check_interval: float = 5.0) -> "OfferResolver":
+        return cls(read_json(path), path=str(path), check_interval=check_interval)
+
+    def maybe_reload(self, force: bool = False) -> bool:
+        """Recompile if the playbook file changed; returns True when it did."""
+        if not self.path:
+            return False
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.check_interval:
+            return False
+        self._checked_at = now
+        try:
+            mtime = os.stat(self.path).st_mtime
+            if mtime == self._mtime:
+                return False
+            table = _DecisionTable(read_json(self.path))
+        except (OSError, ValueError) as exc:
+            # Missing or half-written file: keep the current rules and, since
+            # _mtime is unchanged, retry on the next check.
+            log.warning("Could not reload offer playbook %s: %s", self.path, exc)
+            return False
+        # Swap in a fully built table so concurrent readers never see a partial one.
+        self._table = table
+        self._mtime = mtime
+        return True
+
+    def resolve(self, segment: str, churn: str, category: str) -> str:
+        self.maybe_reload()
+        return self._table.lookup((segment, churn, category))
+
+    def resolve_batch(self, segments: Sequence[str], churns: Sequence[str],
+                      categories: Sequence[str]) -> List[str]:
+        """Resolve column-wise inputs (lists, arrays or pandas Series of equal length)."""
+        self.maybe_reload()
+        table = self._table
+        get = table.rows.get
+        out = []
+        for key in zip(segments, churns, categories):
+            offer = get(key)
+            out.append(offer if offer is not None else table.lookup(key))
+        return out
+
+    def resolve_records(self, records: Iterable[Dict[str, Any]]) -> List[str]:
+        """Resolve knowledge-base records (the shape ``subagent.nudge`` takes)."""
+        segments, churns, categories = [], [], []
+        for r in records:
+            seg = r.get("segmentation", {}) or {}
+            prefs = r.get("product_preferences", {}) or {}
+            segments.append(seg.get("rfm_segment") or "Unknown")
+            churns.append(seg.get("churn_risk") or "")
+            categories.append(prefs.get("primary_category") or "Mixed")
+        return self.resolve_batch(segments, churns, categories)
+
+
+default_resolver = OfferResolver()
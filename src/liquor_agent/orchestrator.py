@@ -2,6 +2,7 @@ import click, datetime as dt, pathlib as p
 from typing import Any, Dict, List
 from .dataio import read_json, write_json
 from .llm_openai import plan_with_openai
+from .records import DEFAULT_CHANNEL, DEFAULT_SEND_WINDOW, Action, Send, actions_from_dicts
 
 PLAYBOOK_FILES = [
     "data/Marketing_Automation_Playbook.md",
@@ -18,7 +19,7 @@ def load_docs() -> List[Dict[str,str]]:
             blobs.append({"name": path.name, "content": path.read_text()})
     return blobs
 
-def heuristic_plan(actions: List[Dict[str,Any]]) -> Dict[str,Any]:
+def heuristic_plan(actions: List[Action]) -> Dict[str,Any]:
     today = dt.date.today()
     days = [today + dt.timedelta(days=i) for i in range(7)]
     plan = {
@@ -30,15 +31,15 @@ def heuristic_plan(actions: List[Dict[str,Any]]) -> Dict[str,Any]:
     }
     for idx, act in enumerate(actions[:200]):
         day = str(days[idx % 7])
-        plan["sends"].append({
-            "date": day,
-            "email": act.get("email"),
-            "channel": act.get("channel", ["Email"]),
-            "send_window": act.get("send_window", ["18:00","22:00"]),
-            "offer": act.get("offer",""),
-            "creative_hint": act.get("creative_hint",""),
-            "segment": act.get("segment","")
-        })
+        plan["sends"].append(Send.create(
+            date=day,
+            email=act.get("email"),
+            channel=act.get("channel", DEFAULT_CHANNEL),
+            send_window=act.get("send_window", DEFAULT_SEND_WINDOW),
+            offer=act.get("offer",""),
+            creative_hint=act.get("creative_hint",""),
+            segment=act.get("segment","")
+        ))
     return plan
 
 @click.command()
@@ -46,7 +47,7 @@ def heuristic_plan(actions: List[Dict[str,Any]]) -> Dict[str,Any]:
 @click.option("--out", "out_path", required=True, type=click.Path(), help="Output weekly plan JSON")
 def main(actions_path, out_path):
     actions_blob = read_json(actions_path)
-    actions = actions_blob.get("actions", [])
+    actions = actions_from_dicts(actions_blob.get("actions", []))
     docs = load_docs()
     llm_plan = plan_with_openai(
         system_prompt="You are a revenue-obsessed liquor retail strategist.",
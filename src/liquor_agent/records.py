@@ -0,0 +1,140 @@
+import sys
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+# Values repeated across millions of records (offers, segments, windows,
+# channels) are stored once and shared by reference.
+_SHARED: Dict[Hashable, Any] = {}
+
+DEFAULT_CHANNEL: Tuple[str, ...] = ("Email",)
+DEFAULT_SEND_WINDOW: Tuple[str, ...] = ("18:00", "22:00")
+
+
+def shared(value: Any) -> Any:
+    """Return the canonical instance of a repeated value.
+
+    Strings go through ``sys.intern``; lists become tuples of interned strings
+    so every record with ``["Email","SMS"]`` points at the same object.
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, (list, tuple)):
+        value = tuple(shared(v) for v in value)
+    return _SHARED.setdefault(value, value)
+
+
+class _Record:
+    """dict-style read access so records drop into code written for dicts.
+
+    Keys outside the record's fields (e.g. extras an LLM plan adds) are kept
+    in ``extra`` and read/serialized like any other key. Fields missing from
+    the source dict are stored as ``None``: ``get`` falls back to the caller's
+    default and ``to_dict`` leaves them out, so sparse rows round-trip.
+    """
+
+    __slots__ = ()
+    _keys: Tuple[str, ...] = ()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._keys:
+            value = getattr(self, key)
+        else:
+            value = (self.extra or {}).get(key)
+        return default if value is None else value
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._keys:
+            return getattr(self, key)
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key) is not None
+
+    def to_dict(self) -> Dict[str, Any]:
+        out = {}
+        for k in self._keys:
+            v = getattr(self, k)
+            if v is None:
+                continue
+            out[k] = list(v) if isinstance(v, tuple) else v
+        if self.extra:
+            out.update(self.extra)
+        return out
+
+    @classmethod
+    def _extra(cls, d: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        return {k: v for k, v in d.items() if k not in cls._keys} or None
+
+
+@dataclass(frozen=True, slots=True)
+class Action(_Record):
+    email: Optional[str]
+    name: Optional[str]
+    segment: Optional[str]
+    primary_category: Optional[str]
+    offer: Optional[str]
+    send_window: Optional[Tuple[str, ...]]
+    channel: Optional[Tuple[str, ...]]
+    creative_hint: Optional[str]
+    reason: Optional[str]
+    extra: Optional[Dict[str, Any]] = field(default=None, hash=False)
+
+    @classmethod
+    def create(cls, email: str, name: str, segment: str, primary_category: str,
+               offer: str, send_window: Iterable[str], channel: Iterable[str],
+               creative_hint: str, reason: str,
+               extra: Optional[Dict[str, Any]] = None) -> "Action":
+        return cls(email, name, shared(segment), shared(primary_category), shared(offer),
+                   shared(send_window), shared(channel), shared(creative_hint), shared(reason),
+                   extra)
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "Action":
+        return cls.create(*(d.get(k) for k in cls._keys), extra=cls._extra(d))
+
+
+@dataclass(frozen=True, slots=True)
+class Send(_Record):
+    date: Optional[str]
+    email: Optional[str]
+    channel: Optional[Tuple[str, ...]]
+    send_window: Optional[Tuple[str, ...]]
+    offer: Optional[str]
+    creative_hint: Optional[str]
+    segment: Optional[str]
+    phone: Optional[str] = None
+    extra: Optional[Dict[str, Any]] = field(default=None, hash=False)
+
+    @classmethod
+    def create(cls, date: str, email: Optional[str], channel: Iterable[str],
+               send_window: Iterable[str], offer: str, creative_hint: str, segment: str,
+               phone: Optional[str] = None, extra: Optional[Dict[str, Any]] = None) -> "Send":
+        return cls(shared(date), email, shared(channel), shared(send_window), shared(offer),
+                   shared(creative_hint), shared(segment), phone, extra)
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "Send":
+        return cls.create(*(d.get(k) for k in cls._keys), extra=cls._extra(d))
+
+
+Action._keys = tuple(f.name for f in fields(Action) if f.name != "extra")
+Send._keys = tuple(f.name for f in fields(Send) if f.name != "extra")
+
+
+def actions_from_dicts(items: Iterable[Dict[str, Any]]) -> List[Action]:
+    return [a if isinstance(a, Action) else Action.from_dict(a) for a in items]
+
+
+def sends_from_dicts(items: Iterable[Dict[str, Any]]) -> List[Send]:
+    return [s if isinstance(s, Send) else Send.from_dict(s) for s in items]
+
+
+def to_jsonable(obj: Any) -> Any:
+    """``json.dump(default=...)`` hook: records serialize to the existing JSON shape."""
+    if isinstance(obj, _Record):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -5,10 +5,60 @@ import click
 
 from .dataio import read_json
 from .pusher import render_email_html, render_subject, render_sms
+from .records import sends_from_dicts
 
 _TRUTHY_VALUES = ("1", "true", "yes")
 
 
+def send_items(sends, mode, send_email, send_sms, delay=0.5, progress=None):
+    """Deliver ``sends`` through the given provider callables.
+
+    Returns sent/failed/skipped counts. An item counts as sent only if a
+    provider was called for it; items with no address for the selected
+    channel(s) are skipped. ``progress`` is an optional
+    :class:`~liquor_agent.progress.CampaignProgress` that receives one event
+    per send plus start/completion events.
+    """
+    sent = failed = skipped = 0
+    if progress:
+        progress.started()
+    for item in sends:
+        try:
+            delivered = False
+            if mode in ("email", "both") and item.get("email"):
+                subj = render_subject(item)
+                html = render_email_html(item)
+                text = item.get("text", "")
+                resp = send_email(item["email"], subj, html, text)
+                print("EMAIL_SENT:", item.get("email"), "->", resp.get("status_code", resp))
+                delivered = True
+
+            if mode in ("sms", "both") and item.get("phone"):
+                sms_body = render_sms(item)
+                resp = send_sms(item["phone"], sms_body)
+                print("SMS_SENT:", item.get("phone"), "->", resp.get("sid", resp))
+                delivered = True
+
+            if not delivered:
+                skipped += 1
+                if progress:
+                    progress.send_completed("skipped", item.get("email"))
+                continue
+            sent += 1
+            if progress:
+                progress.send_completed("sent", item.get("email"))
+            if delay:
+                time.sleep(delay)
+        except Exception as exc:
+            failed += 1
+            print("SEND_ERROR:", repr(exc))
+            if progress:
+                progress.send_completed("failed", item.get("email"))
+    if progress:
+        progress.completed()
+    return {"sent": sent, "failed": failed, "skipped": skipped}
+
+
 @click.command()
 @click.option("--plan", "plan_path", required=True, type=click.Path(exists=True))
 @click.option(
@@ -18,9 +68,14 @@ _TRUTHY_VALUES = ("1", "true", "yes")
     show_default=True,
 )
 @click.option("--limit", default=10, show_default=True)
-def main(plan_path, mode, limit):
+@click.option(
+    "--campaign-id",
+    default=None,
+    help="Publish progress events for this campaign (Redis if REDIS_URL is set).",
+)
+def main(plan_path, mode, limit, campaign_id):
     plan = read_json(plan_path)
-    sends = plan.get("sends", [])[:limit]
+    sends = sends_from_dicts(plan.get("sends", [])[:limit])
 
     providers_enabled = os.getenv("ENABLE_PROVIDERS", "0").lower() in _TRUTHY_VALUES
     if not providers_enabled:
@@ -32,23 +87,13 @@ def main(plan_path, mode, limit):
 
     from .pusher import send_email_mailgun, send_sms_twilio
 
-    for item in sends:
-        try:
-            if mode in ("email", "both") and item.get("email"):
-                subj = render_subject(item)
-                html = render_email_html(item)
-                text = item.get("text", "")
-                resp = send_email_mailgun(item["email"], subj, html, text)
-                print("EMAIL_SENT:", item.get("email"), "->", resp.get("status_code", resp))
+    progress = None
+    if campaign_id:
+        from .progress import CampaignProgress, get_bus
 
-            if mode in ("sms", "both") and item.get("phone"):
-                sms_body = render_sms(item)
-                resp = send_sms_twilio(item["phone"], sms_body)
-                print("SMS_SENT:", item.get("phone"), "->", resp.get("sid", resp))
+        progress = CampaignProgress(get_bus(), campaign_id, len(sends))
 
-            time.sleep(0.5)
-        except Exception as exc:
-            print("SEND_ERROR:", repr(exc))
+    send_items(sends, mode, send_email_mailgun, send_sms_twilio, progress=progress)
 
 
 if __name__ == "__main__":
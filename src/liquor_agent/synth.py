@@ -0,0 +1,90 @@
+import json
+import random
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+import click
+
+# Weights loosely follow what the store sees in production exports: most
+# customers are low churn, a long tail of occasional buyers, vodka/wine heavy.
+CHURN_RISK = (("Low", 0.45), ("Medium", 0.35), ("High", 0.20))
+RFM_SEGMENTS = (
+    ("Champions_High_Value", 0.06),
+    ("Loyal_Very_Frequent", 0.12),
+    ("Low_Value_Frequent", 0.22),
+    ("Potential_Loyalist", 0.15),
+    ("At_Risk", 0.14),
+    ("Hibernating", 0.18),
+    ("New_Customer", 0.13),
+)
+CATEGORIES = (
+    ("Vodka", 0.22), ("Wine", 0.20), ("Whiskey", 0.16), ("Beer", 0.14),
+    ("Tequila", 0.10), ("Rum", 0.08), ("Gin", 0.05), ("Mixed", 0.05),
+)
+NIGHT_BUYER_RATE = 0.3
+
+
+def _table(pairs):
+    values, weights = zip(*pairs)
+    total = sum(weights)
+    cum, acc = [], 0.0
+    for w in weights:
+        acc += w / total
+        cum.append(acc)
+    return values, cum
+
+
+def iter_customers(n: int, seed: int = 42) -> Iterator[Dict[str, Any]]:
+    """Yield ``n`` knowledge-base records; the same ``seed`` always yields the same records."""
+    rng = random.Random(seed)
+    churn_v, churn_w = _table(CHURN_RISK)
+    rfm_v, rfm_w = _table(RFM_SEGMENTS)
+    cat_v, cat_w = _table(CATEGORIES)
+    pick = rng.choices
+    for i in range(n):
+        churn = pick(churn_v, cum_weights=churn_w)[0]
+        rfm = pick(rfm_v, cum_weights=rfm_w)[0]
+        cat = pick(cat_v, cum_weights=cat_w)[0]
+        orders = max(1, int(rng.lognormvariate(1.8, 0.9)))
+        aov = round(rng.lognormvariate(3.6, 0.5), 2)
+        # High churn customers convert worse on past campaigns.
+        success = rng.gauss(35 if churn == "High" else 55, 15)
+        yield {
+            "profile": {"name": f"Customer {i}", "email": f"customer{i}@example.com"},
+            "segmentation": {"rfm_segment": rfm, "churn_risk": churn},
+            "behavioral_traits": {"night_buyer": "Yes" if rng.random() < NIGHT_BUYER_RATE else "No"},
+            "financial_metrics": {
+                "success_rate_pct": round(min(100.0, max(0.0, success)), 1),
+                "total_spent": round(orders * aov, 2),
+                "avg_order_value": aov,
+            },
+            "product_preferences": {"primary_category": cat},
+        }
+
+
+def generate_kb(n: int, seed: int = 42) -> List[Dict[str, Any]]:
+    return list(iter_customers(n, seed))
+
+
+def write_kb(path, n: int, seed: int = 42) -> None:
+    """Stream records to a JSON array so 10M-customer files never sit in memory."""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as fh:
+        fh.write("[")
+        for i, rec in enumerate(iter_customers(n, seed)):
+            fh.write(",\n" if i else "\n")
+            fh.write(json.dumps(rec))
+        fh.write("\n]")
+
+
+@click.command()
+@click.option("--out", "out_path", required=True, type=click.Path())
+@click.option("--n", "n", default=10_000, show_default=True, help="Number of customers")
+@click.option("--seed", default=42, show_default=True)
+def main(out_path, n, seed):
+    write_kb(out_path, n, seed)
+    print(f"Wrote {out_path} with {n} customers.")
+
+
+if __name__ == "__main__":
+    main()
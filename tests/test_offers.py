@@ -0,0 +1,78 @@
+import json
+import os
+
+from liquor_agent.offers import OfferResolver
+from liquor_agent.subagent import nudge
+from liquor_agent.synth import generate_kb
+
+
+def _legacy_offer(record):
+    cat = (record["product_preferences"]["primary_category"] or "Mixed").lower()
+    churn = (record["segmentation"]["churn_risk"] or "").lower()
+    offer = "Discovery pack 3-for-2"
+    if churn == "high":
+        offer = "20% win-back discount"
+    elif any(k in cat for k in ["tequila","whiskey"]):
+        offer = "Premium bundle 15% off"
+    elif any(k in cat for k in ["rum","vodka","beer","wine"]):
+        offer = "Value bundle $50+ free delivery"
+    if "Low_Value_Frequent" in record["segmentation"]["rfm_segment"]:
+        offer = "Bundle uplift: buy 2 get 10% off"
+    return offer
+
+
+def test_default_rules_match_legacy_nudge():
+    kb = generate_kb(2000)
+    assert [nudge(r)["offer"] for r in kb] == [_legacy_offer(r) for r in kb]
+    assert OfferResolver().resolve_records(kb) == [_legacy_offer(r) for r in kb]
+
+
+def test_playbook_segment_offers_and_batch():
+    offers = OfferResolver({"segments": {"At_Risk": {"recommended_offers": ["Come back 25%"]}},
+                            "rules": {"categories": {"gin": "G&T kit"}}})
+    assert offers.resolve_batch(["At_Risk", "At_Risk", "New_Customer", "New_Customer"],
+                                ["High", "Low", "Low", "Low"],
+                                ["Vodka", "Vodka", "Gin", "Beer"]) == [
+        "20% win-back discount", "Come back 25%", "G&T kit", "Value bundle $50+ free delivery"]
+
+
+def test_playbook_segments_match_exactly_and_can_override_churn():
+    offers = OfferResolver({"segments": {
+        "Frequent": {"recommended_offers": ["F"]},
+        "VIP": {"recommended_offers": ["V"], "override_churn": True},
+        "Low_Value_Frequent": {"recommended_offers": ["L"]},
+    }})
+    assert offers.resolve("Very_Frequent", "low", "Wine") == "Value bundle $50+ free delivery"
+    assert offers.resolve("Frequent", "high", "Wine") == "20% win-back discount"
+    assert offers.resolve("VIP", "high", "Wine") == "V"
+    assert offers.resolve("Low_Value_Frequent", "high", "Wine") == "L"
+
+
+def test_hot_reload(tmp_path):
+    path = tmp_path / "segment_playbooks.json"
+    path.write_text(json.dumps({"segments": {"At_Risk": {"recommended_offers": ["A"]}}}))
+    offers = OfferResolver.from_file(path, check_interval=0)
+    assert offers.resolve("At_Risk", "low", "Wine") == "A"
+    path.write_text(json.dumps({"segments": {"At_Risk": {"recommended_offers": ["B"]}}}))
+    st = os.stat(path)
+    os.utime(path, (st.st_atime, st.st_mtime + 10))
+    assert offers.resolve("At_Risk", "low", "Wine") == "B"
+
+
+def test_reload_keeps_rules_when_file_is_truncated_or_missing(tmp_path):
+    path = tmp_path / "segment_playbooks.json"
+    path.write_text(json.dumps({"segments": {"At_Risk": {"recommended_offers": ["A"]}}}))
+    offers = OfferResolver.from_file(path, check_interval=0)
+    path.write_text('{"segments": {"At_Risk": {"recomm')
+    os.utime(path, (os.stat(path).st_atime, os.stat(path).st_mtime + 10))
+    assert offers.resolve("At_Risk", "low", "Wine") == "A"
+    path.unlink()
+    assert offers.resolve_batch(["At_Risk"], ["low"], ["Wine"]) == ["A"]
+    path.write_text(json.dumps({"segments": {"At_Risk": {"recommended_offers": ["B"]}}}))
+    assert offers.resolve("At_Risk", "low", "Wine") == "B"
+
+
+def test_batch_treats_nan_as_missing():
+    nan = float("nan")
+    assert OfferResolver().resolve_batch(["At_Risk", nan], [nan, "high"], ["Rum", None]) == [
+        "Value bundle $50+ free delivery", "20% win-back discount"]
@@ -0,0 +1,54 @@
+import time
+
+from liquor_agent.progress import CampaignProgress, InProcessBus, RedisBus, status_channel
+from liquor_agent.sender import send_items
+
+
+def test_send_items_publishes_progress():
+    bus, events = InProcessBus(), []
+    bus.subscribe(status_channel("c1"), events.append)
+    sends = [{"email": "a@x.com"}, {"email": "b@x.com"}, {"phone": "+15550000000"}]
+
+    def flaky_email(to, subject, html, text=None):
+        if to == "b@x.com":
+            raise RuntimeError("boom")
+        return {"status_code": 200}
+
+    counts = send_items(sends, "email", flaky_email, None, delay=0,
+                        progress=CampaignProgress(bus, "c1", 3))
+    assert counts == {"sent": 1, "failed": 1, "skipped": 1}
+    assert [e["event"] for e in events] == ["campaign_started"] + ["send_completed"] * 3 + ["campaign_completed"]
+    assert [e.get("status") for e in events[1:4]] == ["sent", "failed", "skipped"]
+    assert events[3]["progress"] == {"completed": 3, "total": 3, "percentage": 100.0}
+    assert events[-1]["summary"] == {"total_sends": 3, "successful": 1, "failed": 1, "skipped": 1}
+
+
+class _FakePipe:
+    def __init__(self):
+        self.queued, self.executed = 0, 0
+
+    def publish(self, channel, data):
+        self.queued += 1
+
+    def execute(self):
+        self.executed += self.queued
+        self.queued = 0
+
+
+class _FakeRedis:
+    def __init__(self, pipe):
+        self.pipe = pipe
+
+    def pipeline(self, transaction=True):
+        return self.pipe
+
+
+def test_redis_bus_flushes_on_interval():
+    pipe = _FakePipe()
+    bus = RedisBus("redis://unused", batch_size=100, flush_interval=0.05,
+                   client=_FakeRedis(pipe))
+    bus.publish("c", {"n": 1})
+    assert pipe.executed == 0  # held for batching
+    time.sleep(0.06)
+    bus.publish("c", {"n": 2})
+    assert pipe.executed == 2
@@ -0,0 +1,39 @@
+import json
+
+from liquor_agent.orchestrator import heuristic_plan
+from liquor_agent.pusher import render_sms, render_subject
+from liquor_agent.records import Action, Send, actions_from_dicts, sends_from_dicts, to_jsonable
+from liquor_agent.subagent import build_actions
+
+CUSTOMER = {'profile':{'email':'a@x.com','name':'A'},'segmentation':{'rfm_segment':'Low_Value_Frequent','churn_risk':'High'},'product_preferences':{'primary_category':'Rum'}}
+
+def test_action_round_trip_matches_json_shape():
+    act = build_actions([CUSTOMER])[0]
+    d = json.loads(json.dumps(act, default=to_jsonable))
+    assert d['channel'] == ['Email','SMS'] and d['send_window'] == ['18:00','22:00']
+    assert Action.from_dict(d) == act
+
+def test_shared_values_are_reused():
+    a, b = actions_from_dicts([{'email':'a@x.com','channel':['Email','SMS'],'offer':'x'},
+                               {'email':'b@x.com','channel':['Email','SMS'],'offer':'x'}])
+    assert a.channel is b.channel and a.send_window is b.send_window
+
+def test_plan_sends_are_records():
+    plan = heuristic_plan(build_actions([CUSTOMER]))
+    send = plan['sends'][0]
+    assert isinstance(send, Send) and send['email'] == 'a@x.com'
+    assert 'phone' not in send.to_dict()
+
+def test_send_keeps_keys_outside_schema():
+    row = {'date':'2025-10-20','email':'a@x.com','channel':['Email'],'send_window':['18:00','22:00'],
+           'offer':'X','creative_hint':'','segment':'S','primary_category':'Rum','text':'plain body'}
+    send = Send.from_dict(row)
+    assert render_subject(send) == 'Rum • X' and send.get('text') == 'plain body'
+    assert json.loads(json.dumps(send, default=to_jsonable)) == row
+
+def test_sparse_row_round_trips_and_keeps_render_fallbacks():
+    row = {'date':'2025-10-20','email':'a@x.com','channel':['Email']}
+    send = sends_from_dicts([row])[0]
+    assert send.to_dict() == row and Action.from_dict({'email':'a@x.com'}).to_dict() == {'email':'a@x.com'}
+    assert render_subject(send) == 'Your favorites • Special offer'
+    assert render_sms(send).startswith('Special offer | ')
@@ -0,0 +1,13 @@
+from collections import Counter
+
+from liquor_agent.synth import generate_kb
+
+
+def test_deterministic():
+    assert generate_kb(50, seed=7) == generate_kb(50, seed=7)
+    assert generate_kb(50, seed=7) != generate_kb(50, seed=8)
+
+
+def test_churn_distribution():
+    churn = Counter(r["segmentation"]["churn_risk"] for r in generate_kb(5000))
+    assert 0.15 < churn["High"] / 5000 < 0.25